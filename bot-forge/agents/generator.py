@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
 
 from core.models import ProjectPlan
 
 logger = logging.getLogger("botforge.generator")
 
+MAX_RENDER_WORKERS = 8
+
 
 def _build_jinja_env(templates_dir: Path) -> Environment:
     loaders_dirs = []
@@ -27,18 +40,59 @@ def _build_jinja_env(templates_dir: Path) -> Environment:
         keep_trailing_newline=True,
         trim_blocks=True,
         lstrip_blocks=True,
+        bytecode_cache=FileSystemBytecodeCache(),
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _get_env(templates_dir: str) -> Environment:
+    """Return a shared Environment per templates dir (compiled templates are reused)."""
+    return _build_jinja_env(Path(templates_dir))
+
+
+@dataclass(frozen=True)
+class _TemplateIndex:
+    """Output path -> template name, precomputed from the loader's template list."""
+
+    by_platform: dict[tuple[str, str], str]
+    common: dict[str, str]
+
+
+def _templates_mtime_ns(templates_dir: Path) -> int:
+    """Newest mtime over the templates dir and its subdirectories.
+
+    Adding or removing a template only touches its own directory's mtime, so the
+    root alone would miss changes inside platform subdirectories.
+    """
+    return max(os.stat(root).st_mtime_ns for root, _, _ in os.walk(templates_dir))
+
+
+@functools.lru_cache(maxsize=8)
+def _template_index(templates_dir: str, mtime_ns: int) -> _TemplateIndex:
+    """Index the templates once per templates dir; ``mtime_ns`` invalidates the cache."""
+    by_platform: dict[tuple[str, str], str] = {}
+    common: dict[str, str] = {}
+    for name in _get_env(templates_dir).list_templates():
+        if not name.endswith(".j2"):
+            continue
+        rel_path = name[: -len(".j2")]
+        common[rel_path] = name
+        prefix, sep, rest = rel_path.partition("/")
+        if sep:
+            by_platform[(prefix, rest)] = name
+    return _TemplateIndex(by_platform=by_platform, common=common)
+
+
 def generate_project(plan: ProjectPlan, templates_dir: Path, output_dir: Path) -> Path:
     """Render all planned files into output_dir/<bot-name>/."""
     project_dir = output_dir / plan.spec.name
     project_dir.mkdir(parents=True, exist_ok=True)
 
-    env = _build_jinja_env(templates_dir)
+    env = _get_env(str(templates_dir))
+    index = _template_index(str(templates_dir), _templates_mtime_ns(templates_dir))
 
-    # Template context available in every template
-    ctx = {
+    # Template context available in every template, shared read-only across renders
+    ctx = MappingProxyType({
         "spec": plan.spec,
         "plan": plan,
         "platform": plan.spec.platform.value,
@@ -51,37 +105,33 @@ def generate_project(plan: ProjectPlan, templates_dir: Path, output_dir: Path) -
         "include_docker": plan.spec.include_docker,
         "include_ci": plan.spec.include_ci,
         "include_tests": plan.spec.include_tests,
-    }
+    })
 
-    rendered_count = 0
+    jobs: list[tuple[Template, Path]] = []
     for rel_path in plan.files_to_generate:
-        template_name = _resolve_template(env, plan.spec.platform.value, rel_path)
+        template_name = _resolve_template(index, plan.spec.platform.value, rel_path)
         if template_name is None:
             logger.warning("No template found for %s, skipping", rel_path)
             continue
+        jobs.append((env.get_template(template_name), project_dir / rel_path))
+
+    # Create every parent directory up front so workers only render and write
+    for parent in {out_file.parent for _, out_file in jobs}:
+        parent.mkdir(parents=True, exist_ok=True)
 
-        template = env.get_template(template_name)
-        content = template.render(**ctx)
+    def _render_one(job: tuple[Template, Path]) -> None:
+        template, out_file = job
+        out_file.write_text(template.render(ctx), encoding="utf-8")
 
-        out_file = project_dir / rel_path
-        out_file.parent.mkdir(parents=True, exist_ok=True)
-        out_file.write_text(content, encoding="utf-8")
-        rendered_count += 1
+    if jobs:
+        with ThreadPoolExecutor(max_workers=min(MAX_RENDER_WORKERS, len(jobs))) as pool:
+            list(pool.map(_render_one, jobs))
+    rendered_count = len(jobs)
 
     logger.info("Generated %d/%d files in %s", rendered_count, len(plan.files_to_generate), project_dir)
     return project_dir
 
 
-def _resolve_template(env: Environment, platform: str, rel_path: str) -> str | None:
+def _resolve_template(index: _TemplateIndex, platform: str, rel_path: str) -> str | None:
     """Try platform-specific template first, then common."""
-    candidates = [
-        f"{platform}/{rel_path}.j2",
-        f"{rel_path}.j2",
-    ]
-    for candidate in candidates:
-        try:
-            env.get_template(candidate)
-            return candidate
-        except Exception:
-            continue
-    return None
+    return index.by_platform.get((platform, rel_path)) or index.common.get(rel_path)
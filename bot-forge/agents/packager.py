@@ -4,19 +4,56 @@ from __future__ import annotations
 
 import logging
 import shutil
+import subprocess
+import sys
 import tarfile
 from pathlib import Path
 
 logger = logging.getLogger("botforge.packager")
 
+GZIP_LEVEL = 6
+
 
 def package_project(project_dir: Path) -> Path:
     """Create a tar.gz archive of the project directory."""
     archive_path = project_dir.parent / f"{project_dir.name}.tar.gz"
 
-    with tarfile.open(archive_path, "w:gz") as tar:
-        tar.add(project_dir, arcname=project_dir.name)
+    if not _package_with_tar(project_dir, archive_path):
+        _package_with_tarfile(project_dir, archive_path)
 
     size_kb = archive_path.stat().st_size / 1024
     logger.info("Packaged %s -> %s (%.1f KB)", project_dir.name, archive_path.name, size_kb)
     return archive_path
+
+
+def _package_with_tar(project_dir: Path, archive_path: Path) -> bool:
+    """Stream native `tar` into `pigz` (or `gzip`). Returns False if unavailable or failed."""
+    tar_bin = shutil.which("tar")
+    gz_bin = shutil.which("pigz") or shutil.which("gzip")
+    if tar_bin is None or gz_bin is None:
+        return False
+
+    # File payloads flow tar -> pipe -> gzip -> archive between the child processes;
+    # Python only wires the descriptors and never copies the bytes itself.
+    with open(archive_path, "wb") as out:
+        gz = subprocess.Popen([gz_bin, f"-{GZIP_LEVEL}"], stdin=subprocess.PIPE, stdout=out)
+        tar = subprocess.Popen(
+            [tar_bin, "-C", str(project_dir.parent), "-cf", "-", project_dir.name],
+            stdout=gz.stdin,
+        )
+        gz.stdin.close()
+        tar_code = tar.wait()
+        gz_code = gz.wait()
+
+    if tar_code != 0 or gz_code != 0:
+        logger.warning("tar pipeline failed (tar=%d, gzip=%d), falling back", tar_code, gz_code)
+        return False
+    return True
+
+
+def _package_with_tarfile(project_dir: Path, archive_path: Path) -> None:
+    """Pure-Python fallback using streaming mode (no seeks on the output file)."""
+    # compresslevel is only honoured for stream modes from Python 3.12
+    kwargs = {"compresslevel": GZIP_LEVEL} if sys.version_info >= (3, 12) else {}
+    with open(archive_path, "wb") as out, tarfile.open(fileobj=out, mode="w|gz", **kwargs) as tar:
+        tar.add(project_dir, arcname=project_dir.name)
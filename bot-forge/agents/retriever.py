@@ -38,9 +38,13 @@ PLATFORM_GUIDES: dict[Platform, str] = {
 
 
 def retrieve_context(plan: ProjectPlan) -> ProjectPlan:
-    """Enrich the plan with platform-specific context notes."""
+    """Return a copy of the plan enriched with platform-specific context notes.
+
+    The input plan is left untouched.
+    """
     guide = PLATFORM_GUIDES.get(plan.spec.platform, "")
-    if guide:
-        plan.context_notes.append(f"Platform guide: {guide}")
     logger.info("Context retrieved for platform=%s", plan.spec.platform.value)
-    return plan
+    if not guide:
+        return plan
+    new_notes = [*plan.context_notes, f"Platform guide: {guide}"]
+    return plan.model_copy(update={"context_notes": new_notes})
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import mmap
+import os
+import re
 from pathlib import Path
 
 from core.models import ReviewReport
@@ -17,10 +20,29 @@ BANNED_PATTERNS = [
     "subprocess.call(",
     "os.system(",
 ]
+# One alternation over all patterns so each file is scanned in a single pass
+_BANNED_RE = re.compile(b"|".join(re.escape(p.encode()) for p in BANNED_PATTERNS))
 
+# Generated sources are small: read them in one call and only mmap files larger than this
+MMAP_MIN_SIZE = 64 * 1024
 
-def review_project(project_dir: Path) -> ReviewReport:
-    """Perform structural and basic security review."""
+
+def _find_banned_patterns(py_file: Path) -> list[str]:
+    """Return the banned patterns present in a file, searching raw bytes."""
+    with open(py_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            found = {m.group().decode() for m in _BANNED_RE.finditer(f.read())}
+        else:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                found = {m.group().decode() for m in _BANNED_RE.finditer(mm)}
+            finally:
+                mm.close()
+    return [p for p in BANNED_PATTERNS if p in found]
+
+
+def review_project(project_dir: Path, py_files: list[Path] | None = None) -> ReviewReport:
+    """Perform structural and basic security review over ``py_files`` (default: rglob)."""
     issues: list[str] = []
     warnings: list[str] = []
 
@@ -30,11 +52,11 @@ def review_project(project_dir: Path) -> ReviewReport:
             issues.append(f"Missing required file: {fname}")
 
     # Check for banned patterns in Python files
-    for py_file in project_dir.rglob("*.py"):
-        content = py_file.read_text(encoding="utf-8", errors="replace")
-        for pattern in BANNED_PATTERNS:
-            if pattern in content:
-                warnings.append(f"Potentially unsafe pattern '{pattern}' in {py_file.name}")
+    if py_files is None:
+        py_files = list(project_dir.rglob("*.py"))
+    for py_file in py_files:
+        for pattern in _find_banned_patterns(py_file):
+            warnings.append(f"Potentially unsafe pattern '{pattern}' in {py_file.name}")
 
     # Check README is not empty
     readme = project_dir / "README.md"
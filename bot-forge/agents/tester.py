@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import py_compile
 from pathlib import Path
 
 from core.models import TestResult
@@ -22,19 +23,29 @@ async def _run_cmd(cmd: list[str], cwd: Path) -> tuple[int, str]:
     return proc.returncode or 0, stdout.decode(errors="replace")
 
 
-async def run_tests(project_dir: Path) -> TestResult:
-    """Run ruff check + pytest on the generated project."""
+def _compile_one(py_file: Path) -> str | None:
+    """Byte-compile a file in-process; return the error message on failure."""
+    try:
+        py_compile.compile(str(py_file), doraise=True)
+    except py_compile.PyCompileError as exc:
+        return exc.msg
+    return None
+
+
+async def run_tests(project_dir: Path, py_files: list[Path] | None = None) -> TestResult:
+    """Run ruff check + pytest on the generated project; compile-checks ``py_files`` if given."""
     outputs: list[str] = []
     all_passed = True
 
-    # --- syntax check via py_compile ---
-    py_files = list(project_dir.rglob("*.py"))
+    # --- syntax check via py_compile (in-process, one worker thread per file) ---
+    if py_files is None:
+        py_files = list(project_dir.rglob("*.py"))
+    errors = await asyncio.gather(*(asyncio.to_thread(_compile_one, pf) for pf in py_files))
     compile_failures = 0
-    for pf in py_files:
-        code, out = await _run_cmd(["python3", "-m", "py_compile", str(pf)], cwd=project_dir)
-        if code != 0:
+    for pf, err in zip(py_files, errors, strict=True):
+        if err is not None:
             compile_failures += 1
-            outputs.append(f"COMPILE FAIL {pf.name}: {out}")
+            outputs.append(f"COMPILE FAIL {pf.name}: {err}")
     outputs.append(f"Compile check: {len(py_files) - compile_failures}/{len(py_files)} OK")
     if compile_failures:
         all_passed = False
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -21,5 +22,7 @@ class Settings:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Return the process-wide Settings; env vars are read on first call only."""
     return Settings()
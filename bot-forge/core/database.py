@@ -7,59 +7,141 @@ import logging
 from pathlib import Path
 
 import aiosqlite
+from pydantic import TypeAdapter
 
 from core.models import JobRecord
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup, see the "fast" extra
+    _json_loads = json.loads
+
 logger = logging.getLogger("botforge.db")
 
+# Validates a whole page of records in one call instead of one model_validate per row
+_JOB_LIST_ADAPTER = TypeAdapter(list[JobRecord])
+
 CREATE_TABLE = """
 CREATE TABLE IF NOT EXISTS jobs (
     id TEXT PRIMARY KEY,
     data TEXT NOT NULL,
     created_at TEXT NOT NULL,
-    updated_at TEXT NOT NULL
+    updated_at TEXT NOT NULL,
+    stage TEXT,
+    output_path TEXT,
+    error TEXT
 );
 """
 
+# Mutable scalar columns written by update_stage(); they override the `data` blob on read.
+# Added via ALTER TABLE on databases created before they existed.
+SCALAR_COLUMNS = ("stage", "output_path", "error")
+
+# WAL + synchronous=NORMAL: commits no longer fsync the main database file
+PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+"""
+
 
 class JobRepository:
-    """Async repository wrapping SQLite. Replace with Postgres by swapping this class."""
+    """Async repository wrapping SQLite. Replace with Postgres by swapping this class.
+
+    Holds a single connection for its lifetime; call ``close()`` when done.
+    """
 
     def __init__(self, db_path: Path) -> None:
         self._db_path = db_path
+        self._db: aiosqlite.Connection | None = None
+        self._initialized = False
+
+    async def _conn(self) -> aiosqlite.Connection:
+        if self._db is None:
+            self._db = await aiosqlite.connect(self._db_path)
+            await self._db.executescript(PRAGMAS)
+        return self._db
 
     async def init(self) -> None:
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(CREATE_TABLE)
-            await db.commit()
+        """Create/migrate the schema. Runs once per repository instance."""
+        if self._initialized:
+            return
+        db = await self._conn()
+        await db.execute(CREATE_TABLE)
+        cursor = await db.execute("PRAGMA table_info(jobs)")
+        existing = {row[1] for row in await cursor.fetchall()}
+        for column in SCALAR_COLUMNS:
+            if column not in existing:
+                await db.execute(f"ALTER TABLE jobs ADD COLUMN {column} TEXT")
+        await db.commit()
+        self._initialized = True
         logger.info("Database initialized at %s", self._db_path)
 
+    async def close(self) -> None:
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
     async def save(self, job: JobRecord) -> None:
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(
-                "INSERT OR REPLACE INTO jobs (id, data, created_at, updated_at) VALUES (?, ?, ?, ?)",
-                (job.id, job.model_dump_json(), job.created_at, job.updated_at),
-            )
-            await db.commit()
+        """Write the full record, serializing the whole object graph."""
+        db = await self._conn()
+        await db.execute(
+            "INSERT OR REPLACE INTO jobs"
+            " (id, data, created_at, updated_at, stage, output_path, error)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                job.id,
+                job.model_dump_json(),
+                job.created_at,
+                job.updated_at,
+                job.stage.value,
+                job.output_path,
+                job.error,
+            ),
+        )
+        await db.commit()
+
+    async def update_stage(self, job: JobRecord) -> None:
+        """Persist only the mutable scalar fields of an already-saved record."""
+        db = await self._conn()
+        await db.execute(
+            "UPDATE jobs SET stage = ?, output_path = ?, error = ?, updated_at = ? WHERE id = ?",
+            (job.stage.value, job.output_path, job.error, job.updated_at, job.id),
+        )
+        await db.commit()
 
     async def get(self, job_id: str) -> JobRecord | None:
-        async with aiosqlite.connect(self._db_path) as db:
-            cursor = await db.execute("SELECT data FROM jobs WHERE id = ?", (job_id,))
-            row = await cursor.fetchone()
-            if row is None:
-                return None
-            return JobRecord.model_validate_json(row[0])
+        db = await self._conn()
+        cursor = await db.execute(
+            "SELECT data, stage, output_path, error, updated_at FROM jobs WHERE id = ?", (job_id,)
+        )
+        row = await cursor.fetchone()
+        if row is None:
+            return None
+        return JobRecord.model_validate(_row_to_data(row))
 
     async def list_all(self, limit: int = 50) -> list[JobRecord]:
-        async with aiosqlite.connect(self._db_path) as db:
-            cursor = await db.execute(
-                "SELECT data FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
-            )
-            rows = await cursor.fetchall()
-            return [JobRecord.model_validate_json(r[0]) for r in rows]
+        db = await self._conn()
+        cursor = await db.execute(
+            "SELECT data, stage, output_path, error, updated_at FROM jobs"
+            " ORDER BY created_at DESC LIMIT ?",
+            (limit,),
+        )
+        rows = await cursor.fetchall()
+        return _JOB_LIST_ADAPTER.validate_python([_row_to_data(r) for r in rows])
 
     async def delete(self, job_id: str) -> bool:
-        async with aiosqlite.connect(self._db_path) as db:
-            cursor = await db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
-            await db.commit()
-            return cursor.rowcount > 0
+        db = await self._conn()
+        cursor = await db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        await db.commit()
+        return cursor.rowcount > 0
+
+
+def _row_to_data(row: tuple) -> dict:
+    """Merge the scalar columns over the decoded `data` blob."""
+    data = _json_loads(row[0])
+    stage, output_path, error, updated_at = row[1:]
+    if stage is not None:
+        data.update(stage=stage, output_path=output_path, error=error, updated_at=updated_at)
+    return data
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 
@@ -24,58 +25,63 @@ async def run_pipeline(
     output_dir: Path,
 ) -> JobRecord:
     """Execute the full bot-generation pipeline and return the job record."""
+    # Full record is serialized here and at DONE/FAILED; stages in between
+    # only touch the scalar columns via update_stage().
     job = JobRecord(spec=spec)
     await repo.save(job)
     logger.info("[%s] Pipeline started for bot '%s'", job.id, spec.name)
 
     try:
-        # 1. Intake — spec already validated via Pydantic
-        job.advance(PipelineStage.INTAKE)
-        await repo.save(job)
+        # 1. Intake — spec already validated via Pydantic; the record was
+        # created in this stage and saved above, so there is nothing to write.
         logger.info("[%s] Stage: intake (validated)", job.id)
 
         # 2. Plan
         job.advance(PipelineStage.PLAN)
-        await repo.save(job)
+        await repo.update_stage(job)
         plan = build_plan(spec)
         logger.info("[%s] Stage: plan (%d files planned)", job.id, len(plan.files_to_generate))
 
         # 3. Retrieve docs
         job.advance(PipelineStage.RETRIEVE_DOCS)
-        await repo.save(job)
+        await repo.update_stage(job)
         plan = retrieve_context(plan)
         logger.info("[%s] Stage: retrieve_docs", job.id)
 
         # 4. Generate
         job.advance(PipelineStage.GENERATE)
-        await repo.save(job)
+        await repo.update_stage(job)
         project_dir = generate_project(plan, templates_dir, output_dir)
         job.output_path = str(project_dir)
+        # Test and review both scan every .py file; walk the tree once and hand
+        # them the same list instead of letting each rglob it again
+        py_files = list(project_dir.rglob("*.py"))
         logger.info("[%s] Stage: generate -> %s", job.id, project_dir)
 
-        # 5. Test
+        # 5 + 6. Test and review have no data dependency, so run them side by side
         job.advance(PipelineStage.TEST)
-        await repo.save(job)
-        test_result = await run_tests(project_dir)
+        await repo.update_stage(job)
+        test_result, review = await asyncio.gather(
+            run_tests(project_dir, py_files),
+            asyncio.to_thread(review_project, project_dir, py_files),
+        )
         job.test_result = test_result
         logger.info("[%s] Stage: test (passed=%s)", job.id, test_result.passed)
 
-        # 6. Review
         job.advance(PipelineStage.REVIEW)
-        await repo.save(job)
-        review = review_project(project_dir)
+        await repo.update_stage(job)
         job.review_report = review
         logger.info("[%s] Stage: review (passed=%s)", job.id, review.passed)
 
         # 7. Package
         job.advance(PipelineStage.PACKAGE)
-        await repo.save(job)
+        await repo.update_stage(job)
         archive = package_project(project_dir)
         logger.info("[%s] Stage: package -> %s", job.id, archive)
 
         # 8. Deploy (output to filesystem)
         job.advance(PipelineStage.DEPLOY)
-        await repo.save(job)
+        await repo.update_stage(job)
         logger.info("[%s] Stage: deploy (complete)", job.id)
 
         # Done
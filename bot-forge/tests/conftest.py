@@ -0,0 +1,21 @@
+"""Shared fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from core.database import JobRepository
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "test.db"
+
+
+@pytest.fixture
+async def repo(db_path: Path):
+    """An initialized JobRepository, closed on teardown even if the test fails."""
+    repository = JobRepository(db_path)
+    await repository.init()
+    yield repository
+    await repository.close()
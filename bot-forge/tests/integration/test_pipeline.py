@@ -1,11 +1,9 @@
 """Integration tests: run the full pipeline end-to-end."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
 
-from core.database import JobRepository
 from core.models import BotSpec, EnvVarSpec, PipelineStage, Platform
 from core.pipeline import run_pipeline
 
@@ -15,7 +13,7 @@ def _get_templates_dir() -> Path:
 
 
 @pytest.mark.asyncio
-async def test_full_pipeline_cli_bot():
+async def test_full_pipeline_cli_bot(repo, tmp_path):
     """Run the complete pipeline for a CLI echo bot."""
     spec = BotSpec(
         name="integration-cli-bot",
@@ -24,34 +22,28 @@ async def test_full_pipeline_cli_bot():
         features=["echo"],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp = Path(tmpdir)
-        db_path = tmp / "test.db"
-        output_dir = tmp / "output"
-        output_dir.mkdir()
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
 
-        repo = JobRepository(db_path)
-        await repo.init()
+    job = await run_pipeline(spec, repo, _get_templates_dir(), output_dir)
 
-        job = await run_pipeline(spec, repo, _get_templates_dir(), output_dir)
+    assert job.stage == PipelineStage.DONE
+    assert job.error is None
+    assert job.output_path is not None
 
-        assert job.stage == PipelineStage.DONE
-        assert job.error is None
-        assert job.output_path is not None
+    project_dir = Path(job.output_path)
+    assert project_dir.exists()
+    assert (project_dir / "main.py").exists()
+    assert (project_dir / "README.md").exists()
+    assert (project_dir / "requirements.txt").exists()
 
-        project_dir = Path(job.output_path)
-        assert project_dir.exists()
-        assert (project_dir / "main.py").exists()
-        assert (project_dir / "README.md").exists()
-        assert (project_dir / "requirements.txt").exists()
-
-        # Check archive was created
-        archive = output_dir / f"{spec.name}.tar.gz"
-        assert archive.exists()
+    # Check archive was created
+    archive = output_dir / f"{spec.name}.tar.gz"
+    assert archive.exists()
 
 
 @pytest.mark.asyncio
-async def test_full_pipeline_telegram_bot():
+async def test_full_pipeline_telegram_bot(repo, tmp_path):
     """Run the complete pipeline for a Telegram echo bot."""
     spec = BotSpec(
         name="integration-tg-bot",
@@ -61,28 +53,22 @@ async def test_full_pipeline_telegram_bot():
         env_vars=[EnvVarSpec(name="TELEGRAM_BOT_TOKEN", description="Bot token")],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp = Path(tmpdir)
-        db_path = tmp / "test.db"
-        output_dir = tmp / "output"
-        output_dir.mkdir()
-
-        repo = JobRepository(db_path)
-        await repo.init()
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
 
-        job = await run_pipeline(spec, repo, _get_templates_dir(), output_dir)
+    job = await run_pipeline(spec, repo, _get_templates_dir(), output_dir)
 
-        assert job.stage == PipelineStage.DONE
-        assert job.output_path is not None
+    assert job.stage == PipelineStage.DONE
+    assert job.output_path is not None
 
-        project_dir = Path(job.output_path)
-        main_py = (project_dir / "main.py").read_text()
-        assert "TELEGRAM_BOT_TOKEN" in main_py
-        assert "echo" in (project_dir / "bot" / "handler.py").read_text().lower()
+    project_dir = Path(job.output_path)
+    main_py = (project_dir / "main.py").read_text()
+    assert "TELEGRAM_BOT_TOKEN" in main_py
+    assert "echo" in (project_dir / "bot" / "handler.py").read_text().lower()
 
 
 @pytest.mark.asyncio
-async def test_full_pipeline_web_api_bot():
+async def test_full_pipeline_web_api_bot(repo, tmp_path):
     """Run the complete pipeline for a Web API bot."""
     spec = BotSpec(
         name="integration-api-bot",
@@ -91,23 +77,17 @@ async def test_full_pipeline_web_api_bot():
         features=["echo"],
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp = Path(tmpdir)
-        db_path = tmp / "test.db"
-        output_dir = tmp / "output"
-        output_dir.mkdir()
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
 
-        repo = JobRepository(db_path)
-        await repo.init()
+    job = await run_pipeline(spec, repo, _get_templates_dir(), output_dir)
 
-        job = await run_pipeline(spec, repo, _get_templates_dir(), output_dir)
-
-        assert job.stage == PipelineStage.DONE
-        assert job.output_path is not None
+    assert job.stage == PipelineStage.DONE
+    assert job.output_path is not None
 
 
 @pytest.mark.asyncio
-async def test_job_persisted_in_db():
+async def test_job_persisted_in_db(repo, tmp_path):
     """Verify the job record is persisted and retrievable."""
     spec = BotSpec(
         name="db-test-bot",
@@ -115,22 +95,16 @@ async def test_job_persisted_in_db():
         description="DB persistence test",
     )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp = Path(tmpdir)
-        db_path = tmp / "test.db"
-        output_dir = tmp / "output"
-        output_dir.mkdir()
-
-        repo = JobRepository(db_path)
-        await repo.init()
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
 
-        job = await run_pipeline(spec, repo, _get_templates_dir(), output_dir)
+    job = await run_pipeline(spec, repo, _get_templates_dir(), output_dir)
 
-        retrieved = await repo.get(job.id)
-        assert retrieved is not None
-        assert retrieved.id == job.id
-        assert retrieved.spec.name == "db-test-bot"
-        assert retrieved.stage == PipelineStage.DONE
+    retrieved = await repo.get(job.id)
+    assert retrieved is not None
+    assert retrieved.id == job.id
+    assert retrieved.spec.name == "db-test-bot"
+    assert retrieved.stage == PipelineStage.DONE
 
-        all_jobs = await repo.list_all()
-        assert len(all_jobs) >= 1
+    all_jobs = await repo.list_all()
+    assert len(all_jobs) >= 1
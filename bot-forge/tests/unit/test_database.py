@@ -0,0 +1,67 @@
+"""Unit tests for the job repository."""
+
+import sqlite3
+
+import pytest
+
+from core.database import JobRepository
+from core.models import BotSpec, JobRecord, PipelineStage, Platform
+
+
+def _make_job() -> JobRecord:
+    return JobRecord(spec=BotSpec(name="db-unit-bot", platform=Platform.CLI, description="DB test"))
+
+
+@pytest.fixture
+async def legacy_repo(db_path):
+    """An uninitialized repository over a pre-migration jobs table holding one job."""
+    job = _make_job()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE jobs (id TEXT PRIMARY KEY, data TEXT NOT NULL,"
+            " created_at TEXT NOT NULL, updated_at TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO jobs VALUES (?, ?, ?, ?)",
+            (job.id, job.model_dump_json(), job.created_at, job.updated_at),
+        )
+    conn.close()
+
+    repository = JobRepository(db_path)
+    yield repository, job
+    await repository.close()
+
+
+@pytest.mark.asyncio
+async def test_update_stage_overrides_stored_data(repo):
+    job = _make_job()
+    await repo.save(job)
+    job.advance(PipelineStage.GENERATE)
+    job.output_path = "output/db-unit-bot"
+    await repo.update_stage(job)
+
+    retrieved = await repo.get(job.id)
+    assert retrieved.stage == PipelineStage.GENERATE
+    assert retrieved.output_path == "output/db-unit-bot"
+    assert retrieved.updated_at == job.updated_at
+    assert retrieved.spec.name == "db-unit-bot"
+
+
+@pytest.mark.asyncio
+async def test_init_migrates_legacy_table(legacy_repo):
+    repo, job = legacy_repo
+    await repo.init()
+
+    retrieved = await repo.get(job.id)
+    assert retrieved is not None
+    assert retrieved.stage == PipelineStage.INTAKE
+
+
+@pytest.mark.asyncio
+async def test_init_is_idempotent_across_close(repo):
+    job = _make_job()
+    await repo.save(job)
+    await repo.close()
+
+    await repo.init()
+    assert (await repo.get(job.id)) is not None
@@ -1,9 +1,16 @@
 """Unit tests for the generator agent."""
 
+import os
 import tempfile
 from pathlib import Path
 
-from agents.generator import generate_project
+from agents.generator import (
+    _get_env,
+    _resolve_template,
+    _template_index,
+    _templates_mtime_ns,
+    generate_project,
+)
 from agents.planner import build_plan
 from agents.retriever import retrieve_context
 from core.models import BotSpec, EnvVarSpec, Platform
@@ -75,3 +82,37 @@ def test_generate_includes_docker():
         project_dir = generate_project(plan, _get_templates_dir(), output)
         assert (project_dir / "Dockerfile").exists()
         assert (project_dir / "docker-compose.yml").exists()
+
+
+def test_jinja_env_is_cached():
+    templates_dir = str(_get_templates_dir())
+    assert _get_env(templates_dir) is _get_env(templates_dir)
+
+
+def test_resolve_template_prefers_platform():
+    templates_dir = _get_templates_dir()
+    index = _template_index(str(templates_dir), _templates_mtime_ns(templates_dir))
+    assert _resolve_template(index, "cli", "main.py") == "cli/main.py.j2"
+    assert _resolve_template(index, "cli", "README.md") == "README.md.j2"
+    ci_template = _resolve_template(index, "cli", ".github/workflows/ci.yml")
+    assert ci_template == ".github/workflows/ci.yml.j2"
+    assert _resolve_template(index, "cli", "does-not-exist.txt") is None
+
+
+def test_template_index_sees_templates_added_to_platform_dir(tmp_path):
+    templates_dir = tmp_path / "templates"
+    cli_dir = templates_dir / "cli"
+    cli_dir.mkdir(parents=True)
+    (cli_dir / "main.py.j2").write_text("print('hi')\n")
+    before = _templates_mtime_ns(templates_dir)
+    index = _template_index(str(templates_dir), before)
+    assert _resolve_template(index, "cli", "extra.py") is None
+
+    root_mtime = templates_dir.stat().st_mtime_ns
+    (cli_dir / "extra.py.j2").write_text("X = 1\n")
+    # Coarse filesystem clocks can stamp both writes alike; make the change visible
+    os.utime(cli_dir, ns=(before + 1_000_000_000, before + 1_000_000_000))
+
+    assert templates_dir.stat().st_mtime_ns == root_mtime  # root alone would miss it
+    index = _template_index(str(templates_dir), _templates_mtime_ns(templates_dir))
+    assert _resolve_template(index, "cli", "extra.py") == "cli/extra.py.j2"
@@ -0,0 +1,43 @@
+"""Unit tests for the packager agent."""
+
+import tarfile
+import tempfile
+from pathlib import Path
+
+from agents import packager
+from agents.packager import package_project
+
+
+def _make_project(root: Path) -> Path:
+    project = root / "pkg-bot"
+    (project / "bot").mkdir(parents=True)
+    (project / "main.py").write_text("print('hello')\n")
+    (project / "bot" / "handler.py").write_text("def handle(x):\n    return x\n")
+    return project
+
+
+def _archive_names(archive: Path) -> set[str]:
+    with tarfile.open(archive, "r:gz") as tar:
+        return set(tar.getnames())
+
+
+def test_package_project_creates_archive():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project = _make_project(Path(tmpdir))
+        archive = package_project(project)
+
+        assert archive == project.parent / "pkg-bot.tar.gz"
+        names = _archive_names(archive)
+        assert "pkg-bot/main.py" in names
+        assert "pkg-bot/bot/handler.py" in names
+
+
+def test_package_project_tarfile_fallback(monkeypatch):
+    monkeypatch.setattr(packager.shutil, "which", lambda _: None)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project = _make_project(Path(tmpdir))
+        archive = package_project(project)
+
+        names = _archive_names(archive)
+        assert "pkg-bot/main.py" in names
+        assert "pkg-bot/bot/handler.py" in names
@@ -1,5 +1,7 @@
 """Unit tests for the retriever agent."""
 
+import pytest
+
 from agents.planner import build_plan
 from agents.retriever import retrieve_context
 from core.models import BotSpec, Platform
@@ -13,9 +15,18 @@ def test_retrieve_adds_context():
     assert len(enriched.context_notes) > initial_notes
 
 
-def test_retrieve_all_platforms():
-    for platform in Platform:
-        spec = BotSpec(name=f"ctx-{platform.value}", platform=platform, description="Test")
-        plan = build_plan(spec)
-        enriched = retrieve_context(plan)
-        assert any("guide" in n.lower() or "Platform" in n for n in enriched.context_notes)
+def test_retrieve_does_not_mutate_input_plan():
+    spec = BotSpec(name="ctx-bot", platform=Platform.TELEGRAM, description="Test context")
+    plan = build_plan(spec)
+    notes_before = list(plan.context_notes)
+    enriched = retrieve_context(plan)
+    assert plan.context_notes == notes_before
+    assert enriched is not plan
+
+
+@pytest.mark.parametrize("platform", list(Platform), ids=lambda p: p.value)
+def test_retrieve_context_for_platform(platform):
+    spec = BotSpec(name=f"ctx-{platform.value}", platform=platform, description="Test")
+    plan = build_plan(spec)
+    enriched = retrieve_context(plan)
+    assert any("guide" in n.lower() or "Platform" in n for n in enriched.context_notes)
@@ -0,0 +1,34 @@
+"""Unit tests for the tester agent."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from agents.tester import run_tests
+
+
+@pytest.mark.asyncio
+async def test_compile_check_passes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        p = Path(tmpdir)
+        (p / "main.py").write_text("print('hello')\n")
+        (p / "util.py").write_text("X = 1\n")
+
+        result = await run_tests(p)
+        assert result.passed is True
+        assert result.total == 2
+        assert "Compile check: 2/2 OK" in result.output
+
+
+@pytest.mark.asyncio
+async def test_compile_check_reports_syntax_error():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        p = Path(tmpdir)
+        (p / "main.py").write_text("print('hello')\n")
+        (p / "broken.py").write_text("def oops(:\n")
+
+        result = await run_tests(p)
+        assert result.passed is False
+        assert result.failures == 1
+        assert "COMPILE FAIL broken.py" in result.output
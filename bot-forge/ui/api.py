@@ -38,6 +38,11 @@ async def startup() -> None:
     await _get_repo().init()
 
 
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    await _get_repo().close()
+
+
 class ForgeRequest(BaseModel):
     """Request to generate a new bot."""
     name: str
@@ -86,6 +91,8 @@ async def forge_bot(req: ForgeRequest):
     """Trigger the bot-generation pipeline."""
     settings = get_settings()
     try:
+        # Full validation, not model_construct: ForgeRequest is loosely typed
+        # (platform is a plain str, no name slugging or length limits)
         spec = BotSpec.model_validate(req.model_dump())
     except Exception as e:
         raise HTTPException(status_code=422, detail=str(e))
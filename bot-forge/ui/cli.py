@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import sys
 from pathlib import Path
 
 import click
+from pydantic import TypeAdapter
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -20,7 +21,11 @@ from core.pipeline import run_pipeline
 
 console = Console()
 
+# Built once at import; spec files are parsed and validated in a single pass
+_SPEC_ADAPTER = TypeAdapter(BotSpec)
 
+
+@functools.lru_cache(maxsize=1)
 def _get_repo() -> JobRepository:
     settings = get_settings()
     settings.ensure_dirs()
@@ -47,13 +52,11 @@ def forge(spec_file: str) -> None:
     SPEC_FILE: Path to a JSON file containing the bot specification.
     """
     settings = get_settings()
-    settings.ensure_dirs()
 
-    with open(spec_file, encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = Path(spec_file).read_bytes()
 
     try:
-        spec = BotSpec.model_validate(raw)
+        spec = _SPEC_ADAPTER.validate_json(raw)
     except Exception as e:
         console.print(f"[red]Invalid spec:[/red] {e}")
         raise SystemExit(1)
@@ -67,7 +70,10 @@ def forge(spec_file: str) -> None:
 
     async def _run():
         await repo.init()
-        return await run_pipeline(spec, repo, settings.templates_dir, settings.output_dir)
+        try:
+            return await run_pipeline(spec, repo, settings.templates_dir, settings.output_dir)
+        finally:
+            await repo.close()
 
     job = _run_async(_run())
 
@@ -92,6 +98,24 @@ def forge(spec_file: str) -> None:
         raise SystemExit(1)
 
 
+JOBS_TABLE_COLUMNS = (
+    ("ID", "cyan"),
+    ("Bot Name", "bold"),
+    ("Platform", None),
+    ("Stage", "green"),
+    ("Created", None),
+)
+# Terminal stages get a fixed colour; anything in flight is shown in yellow
+STAGE_STYLES = {PipelineStage.DONE: "green", PipelineStage.FAILED: "red"}
+
+
+def _new_jobs_table() -> Table:
+    table = Table(title="BOT-FORGE Jobs")
+    for header, style in JOBS_TABLE_COLUMNS:
+        table.add_column(header, style=style)
+    return table
+
+
 @main.command()
 def jobs() -> None:
     """List recent bot-generation jobs."""
@@ -99,7 +123,10 @@ def jobs() -> None:
 
     async def _run():
         await repo.init()
-        return await repo.list_all()
+        try:
+            return await repo.list_all()
+        finally:
+            await repo.close()
 
     records = _run_async(_run())
 
@@ -107,15 +134,9 @@ def jobs() -> None:
         console.print("[dim]No jobs found.[/dim]")
         return
 
-    table = Table(title="BOT-FORGE Jobs")
-    table.add_column("ID", style="cyan")
-    table.add_column("Bot Name", style="bold")
-    table.add_column("Platform")
-    table.add_column("Stage", style="green")
-    table.add_column("Created")
-
+    table = _new_jobs_table()
     for job in records:
-        stage_style = "green" if job.stage == PipelineStage.DONE else "red" if job.stage == PipelineStage.FAILED else "yellow"
+        stage_style = STAGE_STYLES.get(job.stage, "yellow")
         table.add_row(
             job.id,
             job.spec.name,
@@ -135,7 +156,10 @@ def status(job_id: str) -> None:
 
     async def _run():
         await repo.init()
-        return await repo.get(job_id)
+        try:
+            return await repo.get(job_id)
+        finally:
+            await repo.close()
 
     job = _run_async(_run())
 
@@ -168,25 +192,30 @@ def status(job_id: str) -> None:
             console.print(f"  [yellow]Warning:[/yellow] {warn}")
 
 
-@main.command()
-def platforms() -> None:
-    """List supported bot platforms."""
+PLATFORMS_INFO = (
+    ("telegram", "Telegram bots using python-telegram-bot"),
+    ("discord", "Discord bots using discord.py"),
+    ("slack", "Slack bots using slack-bolt"),
+    ("cli", "Command-line interface bots using click"),
+    ("web-api", "REST API bots using FastAPI"),
+    ("custom", "Generic bot with minimal scaffolding"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _platforms_table() -> Table:
     table = Table(title="Supported Platforms")
     table.add_column("Platform", style="cyan")
     table.add_column("Description")
-
-    platforms_info = [
-        ("telegram", "Telegram bots using python-telegram-bot"),
-        ("discord", "Discord bots using discord.py"),
-        ("slack", "Slack bots using slack-bolt"),
-        ("cli", "Command-line interface bots using click"),
-        ("web-api", "REST API bots using FastAPI"),
-        ("custom", "Generic bot with minimal scaffolding"),
-    ]
-    for name, desc in platforms_info:
+    for name, desc in PLATFORMS_INFO:
         table.add_row(name, desc)
+    return table
 
-    console.print(table)
+
+@main.command()
+def platforms() -> None:
+    """List supported bot platforms."""
+    console.print(_platforms_table())
 
 
 if __name__ == "__main__":
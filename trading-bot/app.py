@@ -32,10 +32,16 @@ Supported TradingView alert JSON formats:
 """
 
 import asyncio
+import hmac
 import logging
-import json
+import threading
+import time
+from collections import deque
 from datetime import datetime, timezone
-from flask import Flask, request, jsonify
+import orjson
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
+from pydantic import BaseModel, ValidationError, field_validator
 from config import Config
 from mt5_trader import MT5Trader
 
@@ -47,53 +53,177 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify and request.get_json)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
-trader = MT5Trader()
+app.json = ORJSONProvider(app)
 
 # Trade log stored in memory (last 100 trades)
-trade_log = []
 MAX_LOG_SIZE = 100
+trade_log = deque(maxlen=MAX_LOG_SIZE)
+_UTC = timezone.utc
 
 
 def log_trade(action, data, result):
-    """Log trade to in-memory history."""
+    """Log trade to in-memory history (timestamp kept as epoch seconds)."""
     entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": time.time(),
         "action": action,
         "data": data,
         "result": result,
     }
-    trade_log.append(entry)
-    if len(trade_log) > MAX_LOG_SIZE:
-        trade_log.pop(0)
+    trade_log.append(entry)  # deque drops the oldest entry once full
+
+
+def _trade_view(entry):
+    """Render a log entry for output, formatting the timestamp as ISO 8601."""
+    return {**entry, "timestamp": datetime.fromtimestamp(entry["timestamp"], _UTC).isoformat()}
+
+
+class WebhookPayload(BaseModel):
+    """TradingView alert body; validated and coerced in one pass (extra keys ignored)."""
+
+    action: str = ""
+    symbol: str = ""
+    lot_size: float = Config.DEFAULT_LOT_SIZE
+    sl_pips: float | None = None
+    tp_pips: float | None = None
+    position_id: str | int | None = None
+
+    @field_validator("action")
+    @classmethod
+    def _lower_action(cls, v):
+        return v.lower()
+
+    @field_validator("symbol")
+    @classmethod
+    def _upper_symbol(cls, v):
+        return v.upper()
+
+
+# Webhook secret bound once at import (Config is read from the environment once anyway)
+_SECRET_BYTES = Config.WEBHOOK_SECRET.encode()
+_REQUIRE_AUTH = bool(_SECRET_BYTES)
+
+
+def _auth_ok(received_secret):
+    """Constant-time check of the webhook secret (always OK when none is configured)."""
+    if not _REQUIRE_AUTH:
+        return True
+    return hmac.compare_digest(str(received_secret or "").encode(), _SECRET_BYTES)
+
+
+# One long-lived event loop for all MetaApi calls. The trader's connection is
+# bound to the loop it was created on, so every request must reuse it.
+_loop = asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever, name="asyncio-loop", daemon=True).start()
 
 
 def run_async(coro):
-    """Run async function in sync context."""
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    """Run async function in sync context on the shared background loop."""
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+_trader = None
+_trader_lock = threading.Lock()
+
+
+def get_trader():
+    """Create the MT5Trader on first use instead of at import time.
+
+    gthread workers serve requests from several threads, so construction is
+    locked: a second trader would mean a second connection and position map.
+    """
+    global _trader
+    if _trader is None:
+        with _trader_lock:
+            if _trader is None:
+                _trader = MT5Trader()
+    return _trader
+
+
+def warm_up():
+    """Start connecting to MetaApi in the background so the first alert doesn't wait."""
+    asyncio.run_coroutine_threadsafe(get_trader().ensure_connected(), _loop)
+
+
+async def _account_snapshot():
+    """Fetch account info and open positions concurrently."""
+    trader = get_trader()
+    await trader.ensure_connected()
+    return await asyncio.gather(trader.get_account_info(), trader.get_open_positions())
+
+
+# Static status payload, serialized once at import
+HOME_JSON = orjson.dumps(
+    {
+        "status": "running",
+        "bot": "TradingView-MT5 Bot",
+        "version": "1.0.0",
+        "message": "Bot is active. Send POST to /webhook with TradingView alerts.",
+        "endpoints": {
+            "webhook": "POST /webhook - Receive TradingView alerts",
+            "status": "GET /status - Account info and open positions",
+            "trades": "GET /trades - Recent trade history",
+            "health": "GET / - This page",
+        },
+    }
+)
 
 
 @app.route("/", methods=["GET"])
 def home():
     """Health check and status page."""
-    return jsonify(
-        {
-            "status": "running",
-            "bot": "TradingView-MT5 Bot",
-            "version": "1.0.0",
-            "message": "Bot is active. Send POST to /webhook with TradingView alerts.",
-            "endpoints": {
-                "webhook": "POST /webhook - Receive TradingView alerts",
-                "status": "GET /status - Account info and open positions",
-                "trades": "GET /trades - Recent trade history",
-                "health": "GET / - This page",
-            },
-        }
+    return Response(HOME_JSON, mimetype="application/json")
+
+
+def _trade_response(action, data, result):
+    log_trade(action, data, result)
+    return result, 200 if result.get("success") else 400
+
+
+def _handle_open(payload, data):
+    if not payload.symbol:
+        return {"error": "Symbol is required for buy/sell"}, 400
+    result = run_async(
+        get_trader().open_trade(
+            payload.symbol, payload.action, payload.lot_size, payload.sl_pips, payload.tp_pips
+        )
+    )
+    return _trade_response(payload.action, data, result)
+
+
+def _handle_close(payload, data):
+    if not payload.symbol:
+        return {"error": "Symbol is required for close"}, 400
+    result = run_async(
+        get_trader().close_trade(symbol=payload.symbol, position_id=payload.position_id)
     )
+    return _trade_response(payload.action, data, result)
+
+
+def _handle_close_all(payload, data):
+    result = run_async(get_trader().close_all())
+    return _trade_response(payload.action, data, result)
+
+
+# Action -> handler; each handler returns (response body, status code)
+_ACTION_HANDLERS = {
+    "buy": _handle_open,
+    "sell": _handle_open,
+    "close": _handle_close,
+    "close_all": _handle_close_all,
+}
+SUPPORTED_ACTIONS = list(_ACTION_HANDLERS)
 
 
 @app.route("/webhook", methods=["POST"])
@@ -105,76 +235,54 @@ def webhook():
     The bot validates the secret, parses the signal, and executes the trade.
     """
     try:
-        # Parse request data
-        if request.content_type and "json" in request.content_type:
-            data = request.get_json(silent=True)
-        else:
-            # TradingView sometimes sends as plain text
-            raw = request.get_data(as_text=True)
-            try:
-                data = json.loads(raw)
-            except json.JSONDecodeError:
-                logger.warning(f"Invalid JSON received: {raw[:200]}")
-                return jsonify({"error": "Invalid JSON"}), 400
+        # Parse request data. force=True also covers TradingView's text/plain
+        # bodies; the buffered bytes are parsed once, with no str decode.
+        data = request.get_json(force=True, silent=True)
+        if data is None and request.content_length:
+            raw = request.get_data()
+            logger.warning(f"Invalid JSON received: {raw[:200]!r}")
+            return jsonify({"error": "Invalid JSON"}), 400
 
         if not data:
             return jsonify({"error": "No data received"}), 400
+        if not isinstance(data, dict):
+            return jsonify({"error": "Invalid payload", "details": "Expected a JSON object"}), 400
 
-        logger.info(f"Webhook received: {json.dumps(data)}")
+        logger.info(f"Webhook received: {orjson.dumps(data).decode()}")
 
         # Validate webhook secret
-        if Config.WEBHOOK_SECRET:
-            received_secret = data.get("secret", "")
-            if received_secret != Config.WEBHOOK_SECRET:
-                logger.warning("Invalid webhook secret received")
-                return jsonify({"error": "Unauthorized"}), 401
-
-        action = data.get("action", "").lower()
-        symbol = data.get("symbol", "").upper()
-        lot_size = float(data.get("lot_size", Config.DEFAULT_LOT_SIZE))
-        sl_pips = data.get("sl_pips")
-        tp_pips = data.get("tp_pips")
-
-        if sl_pips is not None:
-            sl_pips = float(sl_pips)
-        if tp_pips is not None:
-            tp_pips = float(tp_pips)
-
-        # Execute action
-        if action in ("buy", "sell"):
-            if not symbol:
-                return jsonify({"error": "Symbol is required for buy/sell"}), 400
-
-            result = run_async(
-                trader.open_trade(symbol, action, lot_size, sl_pips, tp_pips)
+        if not _auth_ok(data.get("secret")):
+            logger.warning("Invalid webhook secret received")
+            return jsonify({"error": "Unauthorized"}), 401
+
+        try:
+            payload = WebhookPayload.model_validate(data)
+        except ValidationError as e:
+            logger.warning(f"Invalid webhook payload: {e}")
+            return (
+                jsonify(
+                    {
+                        "error": "Invalid payload",
+                        "details": e.errors(include_url=False, include_context=False),
+                    }
+                ),
+                400,
             )
-            log_trade(action, data, result)
-            return jsonify(result), 200 if result.get("success") else 400
 
-        elif action == "close":
-            if not symbol:
-                return jsonify({"error": "Symbol is required for close"}), 400
-
-            position_id = data.get("position_id")
-            result = run_async(trader.close_trade(symbol=symbol, position_id=position_id))
-            log_trade(action, data, result)
-            return jsonify(result), 200 if result.get("success") else 400
-
-        elif action == "close_all":
-            result = run_async(trader.close_all())
-            log_trade(action, data, result)
-            return jsonify(result), 200 if result.get("success") else 400
-
-        else:
+        # Execute action
+        handler = _ACTION_HANDLERS.get(payload.action)
+        if handler is None:
             return (
                 jsonify(
                     {
-                        "error": f"Unknown action: {action}",
-                        "supported_actions": ["buy", "sell", "close", "close_all"],
+                        "error": f"Unknown action: {payload.action}",
+                        "supported_actions": SUPPORTED_ACTIONS,
                     }
                 ),
                 400,
             )
+        body, status_code = handler(payload, data)
+        return jsonify(body), status_code
 
     except Exception as e:
         logger.error(f"Webhook error: {e}", exc_info=True)
@@ -185,8 +293,7 @@ def webhook():
 def status():
     """Get account status and open positions."""
     try:
-        account_info = run_async(trader.get_account_info())
-        positions = run_async(trader.get_open_positions())
+        account_info, positions = run_async(_account_snapshot())
 
         position_list = []
         for pos in (positions or []):
@@ -219,7 +326,15 @@ def status():
 @app.route("/trades", methods=["GET"])
 def trades():
     """Get recent trade history."""
-    return jsonify({"trades": trade_log, "total": len(trade_log)})
+    snapshot = list(trade_log)  # copy first so appends during streaming are harmless
+
+    def _stream():
+        yield b'{"trades":['
+        for i, entry in enumerate(snapshot):
+            yield (b"," if i else b"") + orjson.dumps(_trade_view(entry), default=str)
+        yield b'],"total":%d}' % len(snapshot)
+
+    return Response(_stream(), mimetype="application/json")
 
 
 if __name__ == "__main__":
@@ -227,4 +342,6 @@ if __name__ == "__main__":
     logger.info(f"Webhook secret configured: {'Yes' if Config.WEBHOOK_SECRET else 'No'}")
     logger.info(f"Default lot size: {Config.DEFAULT_LOT_SIZE}")
     logger.info(f"Max open trades: {Config.MAX_OPEN_TRADES}")
+    # Local development only; production runs under gunicorn (see gunicorn.conf.py)
+    warm_up()
     app.run(host="0.0.0.0", port=Config.PORT, debug=False)
@@ -19,5 +19,11 @@ class Config:
     DEFAULT_SL_PIPS = float(os.getenv("DEFAULT_SL_PIPS", "50"))
     DEFAULT_TP_PIPS = float(os.getenv("DEFAULT_TP_PIPS", "100"))
 
+    # Keep a streaming connection for pushed price ticks (otherwise one RPC per trade)
+    STREAM_PRICES = os.getenv("STREAM_PRICES", "false").lower() == "true"
+
+    # Symbol specification cache file (empty to keep it in memory only)
+    SPEC_CACHE_PATH = os.getenv("SPEC_CACHE_PATH", "symbol_specs.json")
+
     # Server
     PORT = int(os.getenv("PORT", "5000"))
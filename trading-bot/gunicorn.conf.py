@@ -0,0 +1,23 @@
+"""
+Gunicorn settings (loaded automatically when gunicorn starts in this directory).
+
+A single worker process is required: the trade log and the MetaApi
+connection live in process memory. Concurrency comes from threads, which
+share the background asyncio loop in app.py. gevent/eventlet workers are
+not used because monkey-patching would break that loop thread.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = 1
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+timeout = 60
+
+
+def post_worker_init(worker):
+    """Begin the MetaApi connection as soon as the worker is up, off the request path."""
+    import app
+
+    app.warm_up()
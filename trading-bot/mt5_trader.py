@@ -5,27 +5,189 @@ MetaApi provides cloud access to MT5 accounts - no local MT5 terminal needed.
 This allows the bot to run entirely on a cloud server (works from phone).
 """
 
+import asyncio
+import json
 import logging
-from metaapi_cloud_sdk import MetaApi
+import os
+import tempfile
+import time
+from typing import Any, NamedTuple, Optional
+
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Symbol specifications (digits etc.) practically never change; refetch weekly.
+# The cache is also kept on disk (Config.SPEC_CACHE_PATH) to survive restarts.
+SPEC_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Positions also close server-side (SL/TP hits, manual closes), so the locally
+# tracked positions are resynced from the broker when older than this
+POSITIONS_RESYNC_SECONDS = 30
+
+# Bursts of account reads (status polling, position sizing) share one RPC
+ACCOUNT_INFO_TTL = 1.0
+
+# Pip size overrides by symbol, then by quote precision (digits)
+PIP_SIZE_TABLE = {"XAUUSD": 0.1, "GOLD": 0.1}
+DIGITS_TO_PIP = {2: 0.01, 3: 0.01, 4: 0.0001, 5: 0.0001}
+
+
+def pip_size_for(symbol, digits):
+    """Pip size for a symbol: gold and JPY pairs are special, others go by digits."""
+    return PIP_SIZE_TABLE.get(symbol) or (
+        0.01 if "JPY" in symbol else DIGITS_TO_PIP.get(digits, 0.0001)
+    )
+
+
+# Market order method on the RPC connection for each trade action
+_ORDER_METHODS = {"buy": "create_market_buy_order", "sell": "create_market_sell_order"}
+_VALID_ACTIONS = frozenset(_ORDER_METHODS)
+
+# Fields of a MetaApi trade response worth returning to callers
+RESULT_FIELDS = ("stringCode", "orderId", "positionId")
+
+
+def _trade_result(result):
+    """Trim a MetaApi trade response to its outcome code and ids."""
+    if not isinstance(result, dict):
+        return str(result)
+    return {field: result.get(field) for field in RESULT_FIELDS}
+
+
+class _Trade(NamedTuple):
+    """A signal accepted by open_trades, normalized and awaiting its order."""
+
+    index: int  # position in the signals list, for result ordering
+    symbol: str
+    action: str
+    lot_size: float
+    sl_pips: float
+    tp_pips: float
+
+
+def _load_spec_cache(path):
+    """Load unexpired symbol specs saved by _save_spec_cache, or {} if unavailable."""
+    if not path or not os.path.exists(path):
+        return {}
+    now = time.time()
+    try:
+        with open(path, encoding="utf-8") as f:
+            saved = json.load(f)
+        return {
+            symbol: (entry["spec"], entry["fetched_at"])
+            for symbol, entry in saved.items()
+            if now - entry["fetched_at"] < SPEC_CACHE_TTL
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        logger.warning(f"Ignoring unreadable spec cache {path}: {e}")
+        return {}
+
+
+def _save_spec_cache(path, cache):
+    """Write the spec cache atomically (temp file + rename); skip it if not JSON-able."""
+    if not path:
+        return
+    saved = {symbol: {"spec": spec, "fetched_at": at} for symbol, (spec, at) in cache.items()}
+    tmp_path = None
+    try:
+        data = json.dumps(saved)
+        # Unique temp name: saves for different symbols may overlap in threads
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not save spec cache {path}: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _sl_tp(action, ask, bid, sl_pips, tp_pips, pip_size, digits):
+    """
+    Stop loss and take profit prices, rounded to the symbol's digits.
+
+    Both are measured from the entry price: ask for a buy, bid for a sell.
+    A missing/zero pip distance yields None for that level.
+    """
+    if action == "buy":
+        entry, direction = ask, 1
+    else:
+        entry, direction = bid, -1
+    sl = round(entry - direction * sl_pips * pip_size, digits) if sl_pips else None
+    tp = round(entry + direction * tp_pips * pip_size, digits) if tp_pips else None
+    return sl, tp
+
 
 class MT5Trader:
+    __slots__ = (
+        "api",
+        "account",
+        "connection",
+        "connected",
+        "streaming",
+        "_streaming_task",
+        "_price_subscriptions",
+        "_spec_cache",
+        "_pip_cache",
+        "_positions_by_id",
+        "_positions_synced_at",
+        "_pending_opens",
+        "_account_info",
+        "_account_info_at",
+        "_connect_lock",
+    )
+
     def __init__(self):
-        self.api = None
-        self.account = None
-        self.connection = None
-        self.connected = False
+        self.api: Optional[Any] = None  # MetaApi client, created on first connect()
+        self.account: Optional[Any] = None
+        self.connection: Optional[Any] = None
+        self.connected: bool = False
+        # Optional streaming connection (Config.STREAM_PRICES) whose terminal
+        # state holds the latest pushed price for each subscribed symbol
+        self.streaming: Optional[Any] = None
+        self._streaming_task: Optional[asyncio.Task] = None
+        self._price_subscriptions: dict[str, asyncio.Task] = {}
+        # symbol -> (specification dict, epoch fetch time)
+        self._spec_cache: dict[str, tuple[dict, float]] = {}
+        # symbol -> pip size derived from the cached spec
+        self._pip_cache: dict[str, float] = {}
+        # position id -> position dict, from the last listing plus our own opens/closes
+        self._positions_by_id: dict[str, dict] = {}
+        self._positions_synced_at: float = 0.0
+        # Slots reserved by orders still in flight; concurrent open_trades calls
+        # would otherwise all pass the cap before any position is recorded
+        self._pending_opens: int = 0
+        self._account_info: Optional[dict] = None
+        self._account_info_at: float = 0.0
+        self._connect_lock: asyncio.Lock = asyncio.Lock()
 
     async def connect(self):
-        """Connect to MT5 account via MetaApi."""
+        """Connect to MT5 account via MetaApi.
+
+        The MetaApi client, account and RPC connection are kept across
+        reconnects: the SDK multiplexes every RPC for an account over one
+        websocket, so rebuilding them only adds handshakes. The account is
+        reloaded on reconnect so its deployment state is current.
+        """
+        if not self._spec_cache:
+            self._spec_cache = _load_spec_cache(Config.SPEC_CACHE_PATH)
         try:
-            self.api = MetaApi(Config.METAAPI_TOKEN)
-            self.account = await self.api.metatrader_account_api.get_account(
-                Config.METAAPI_ACCOUNT_ID
-            )
+            if self.api is None:
+                # Imported here: the SDK (aiohttp, socketio, ...) is heavy and
+                # only needed once we actually talk to MetaApi
+                from metaapi_cloud_sdk import MetaApi
+
+                self.api = MetaApi(Config.METAAPI_TOKEN)
+            if self.account is None:
+                self.account = await self.api.metatrader_account_api.get_account(
+                    Config.METAAPI_ACCOUNT_ID
+                )
+            else:
+                # MetaApi undeploys idle accounts; refresh state before checking it
+                await self.account.reload()
 
             if self.account.state != "DEPLOYED":
                 logger.info("Deploying MT5 account...")
@@ -34,12 +196,20 @@ class MT5Trader:
             logger.info("Waiting for MT5 API server connection...")
             await self.account.wait_connected()
 
-            self.connection = self.account.get_rpc_connection()
+            if self.connection is None:
+                self.connection = self.account.get_rpc_connection()
             await self.connection.connect()
             await self.connection.wait_synchronized()
 
             self.connected = True
             logger.info("Successfully connected to MT5 account via MetaApi")
+            if Config.STREAM_PRICES and self.streaming is None and (
+                self._streaming_task is None or self._streaming_task.done()
+            ):
+                # Synchronizing the stream can take a while; trades go over RPC
+                # meanwhile, so don't hold up connect() (and its lock) for it
+                self._streaming_task = asyncio.create_task(self._start_streaming())
+            await self.get_open_positions()
             return True
 
         except Exception as e:
@@ -47,11 +217,65 @@ class MT5Trader:
             self.connected = False
             return False
 
+    async def _start_streaming(self):
+        """Open the streaming connection; trading keeps working over RPC if it fails."""
+        try:
+            streaming = self.account.get_streaming_connection()
+            await streaming.connect()
+            await streaming.wait_synchronized()
+            self.streaming = streaming
+            self._price_subscriptions.clear()
+            logger.info("Price streaming connection synchronized")
+        except Exception as e:
+            logger.warning(f"Price streaming unavailable, using RPC prices: {e}")
+
+    async def _get_price(self, symbol):
+        """Latest streamed price for a symbol, falling back to an RPC round-trip."""
+        if self.streaming is not None:
+            state = self.streaming.terminal_state
+            if state.connected_to_broker:
+                price = state.price(symbol)
+                if price:
+                    return price
+            if symbol not in self._price_subscriptions:
+                # Subscribe in the background; this trade still uses the RPC
+                task = asyncio.create_task(self.streaming.subscribe_to_market_data(symbol))
+                task.add_done_callback(lambda t: self._subscription_done(symbol, t))
+                self._price_subscriptions[symbol] = task
+        return await self.connection.get_symbol_price(symbol)
+
+    def _subscription_done(self, symbol, task):
+        """Forget failed subscriptions so the next trade on the symbol retries."""
+        if task.cancelled():
+            error = "cancelled"
+        elif task.exception() is not None:
+            error = task.exception()
+        else:
+            return
+        logger.warning(f"Price subscription for {symbol} failed: {error}")
+        if self._price_subscriptions.get(symbol) is task:
+            del self._price_subscriptions[symbol]
+
+    async def ensure_connected(self):
+        """Connect if needed; concurrent callers wait for a single connect()."""
+        if self.connected:
+            return
+        async with self._connect_lock:
+            if not self.connected:
+                await self.connect()
+
     async def disconnect(self):
         """Disconnect from MT5 account."""
         try:
+            if self._streaming_task is not None and not self._streaming_task.done():
+                self._streaming_task.cancel()
+            self._streaming_task = None
+            if self.streaming:
+                await self.streaming.close()
+                self.streaming = None
             if self.connection:
                 await self.connection.close()
+                self.connection = None
             self.connected = False
             logger.info("Disconnected from MT5")
         except Exception as e:
@@ -59,11 +283,15 @@ class MT5Trader:
 
     async def get_account_info(self):
         """Get MT5 account information."""
-        if not self.connected:
-            await self.connect()
+        await self.ensure_connected()
+        if (
+            self._account_info is not None
+            and time.monotonic() - self._account_info_at < ACCOUNT_INFO_TTL
+        ):
+            return dict(self._account_info)
         try:
             info = await self.connection.get_account_information()
-            return {
+            self._account_info = {
                 "balance": info.get("balance"),
                 "equity": info.get("equity"),
                 "margin": info.get("margin"),
@@ -71,21 +299,43 @@ class MT5Trader:
                 "leverage": info.get("leverage"),
                 "currency": info.get("currency"),
             }
+            self._account_info_at = time.monotonic()
+            return dict(self._account_info)
         except Exception as e:
             logger.error(f"Failed to get account info: {e}")
             return None
 
     async def get_open_positions(self):
         """Get all open positions."""
-        if not self.connected:
-            await self.connect()
+        await self.ensure_connected()
         try:
             positions = await self.connection.get_positions()
+            self._positions_by_id = {str(pos.get("id")): pos for pos in positions}
+            self._positions_synced_at = time.monotonic()
             return positions
         except Exception as e:
             logger.error(f"Failed to get positions: {e}")
             return []
 
+    async def _get_spec(self, symbol):
+        """Get a symbol specification, calling the RPC only on a cache miss or expiry."""
+        cached = self._spec_cache.get(symbol)
+        if cached is not None and time.time() - cached[1] < SPEC_CACHE_TTL:
+            return cached[0]
+        spec = await self.connection.get_symbol_specification(symbol)
+        self._spec_cache[symbol] = (spec, time.time())
+        self._pip_cache.pop(symbol, None)
+        # File I/O stays off the shared event loop thread; save a snapshot
+        await asyncio.to_thread(_save_spec_cache, Config.SPEC_CACHE_PATH, dict(self._spec_cache))
+        return spec
+
+    def _pip_size(self, symbol, digits):
+        """Pip size for a symbol, derived once per cached specification."""
+        pip_size = self._pip_cache.get(symbol)
+        if pip_size is None:
+            pip_size = self._pip_cache[symbol] = pip_size_for(symbol, digits)
+        return pip_size
+
     async def open_trade(self, symbol, action, lot_size, sl_pips=None, tp_pips=None):
         """
         Open a new trade on MT5.
@@ -100,82 +350,136 @@ class MT5Trader:
         Returns:
             Trade result dict or None on failure
         """
-        if not self.connected:
-            await self.connect()
-
-        # Enforce max lot size
-        lot_size = min(lot_size, Config.MAX_LOT_SIZE)
-
-        # Check max open trades
-        positions = await self.get_open_positions()
-        if len(positions) >= Config.MAX_OPEN_TRADES:
-            logger.warning(
-                f"Max open trades ({Config.MAX_OPEN_TRADES}) reached. "
-                f"Rejecting new trade."
+        signal = {
+            "symbol": symbol,
+            "action": action,
+            "lot_size": lot_size,
+            "sl_pips": sl_pips,
+            "tp_pips": tp_pips,
+        }
+        return (await self.open_trades([signal]))[0]
+
+    async def open_trades(self, signals):
+        """
+        Open several trades at once, sharing the per-trade overhead.
+
+        The max open trades check runs once for the batch, price and
+        specification are fetched once per distinct symbol, and the orders
+        are sent concurrently.
+
+        Args:
+            signals: List of dicts with the open_trade arguments
+                (symbol, action, lot_size and optional sl_pips/tp_pips)
+
+        Returns:
+            List of trade result dicts, in the same order as signals
+        """
+        await self.ensure_connected()
+
+        actions = [signal["action"].lower() for signal in signals]
+        wanted = sum(action in _VALID_ACTIONS for action in actions)
+
+        # Check max open trades against the locally tracked positions. The
+        # tracked count only saves an RPC while there is headroom: it misses
+        # positions opened elsewhere and still counts ones closed at the
+        # broker (SL/TP), so resync before rejecting anything.
+        synced = False
+        if time.monotonic() - self._positions_synced_at > POSITIONS_RESYNC_SECONDS:
+            await self.get_open_positions()
+            synced = True
+        if self._free_slots() < wanted and not synced:
+            await self.get_open_positions()
+        # No awaits from here until the slots are reserved below
+        free_slots = self._free_slots()
+
+        results = [None] * len(signals)
+        accepted = []
+        for i, (signal, action) in enumerate(zip(signals, actions, strict=True)):
+            if action not in _VALID_ACTIONS:
+                results[i] = {"success": False, "error": f"Invalid action: {action}"}
+                continue
+            if free_slots <= 0:
+                logger.warning(
+                    f"Max open trades ({Config.MAX_OPEN_TRADES}) reached. "
+                    f"Rejecting new trade."
+                )
+                results[i] = {
+                    "success": False,
+                    "error": f"Max open trades limit ({Config.MAX_OPEN_TRADES}) reached",
+                }
+                continue
+            free_slots -= 1
+            accepted.append(
+                _Trade(
+                    index=i,
+                    symbol=signal["symbol"],
+                    action=action,
+                    # Enforce max lot size
+                    lot_size=min(signal["lot_size"], Config.MAX_LOT_SIZE),
+                    sl_pips=signal.get("sl_pips") or Config.DEFAULT_SL_PIPS,
+                    tp_pips=signal.get("tp_pips") or Config.DEFAULT_TP_PIPS,
+                )
             )
-            return {
-                "success": False,
-                "error": f"Max open trades limit ({Config.MAX_OPEN_TRADES}) reached",
-            }
 
+        self._pending_opens += len(accepted)
         try:
-            # Get current price for SL/TP calculation
-            price = await self.connection.get_symbol_price(symbol)
+            symbols = list(dict.fromkeys(trade.symbol for trade in accepted))
+            quotes = await asyncio.gather(
+                *(self._get_quote(symbol) for symbol in symbols), return_exceptions=True
+            )
+            quotes = dict(zip(symbols, quotes, strict=True))
+
+            placed = await asyncio.gather(
+                *(self._place_order(trade, quotes[trade.symbol]) for trade in accepted)
+            )
+        finally:
+            # Placed orders are tracked in _positions_by_id by now
+            self._pending_opens -= len(accepted)
+        for trade, result in zip(accepted, placed, strict=True):
+            results[trade.index] = result
+        return results
+
+    def _free_slots(self):
+        """Trades that may still open: the cap minus tracked and in-flight positions."""
+        return Config.MAX_OPEN_TRADES - len(self._positions_by_id) - self._pending_opens
+
+    async def _get_quote(self, symbol):
+        """Current price for SL/TP and the (usually cached) spec, fetched concurrently."""
+        return await asyncio.gather(self._get_price(symbol), self._get_spec(symbol))
+
+    async def _place_order(self, trade, quote):
+        """Send one market order using a quote from _get_quote (or its exception)."""
+        symbol, action, lot_size = trade.symbol, trade.action, trade.lot_size
+        try:
+            if isinstance(quote, Exception):
+                raise quote
+            price, spec = quote
             if not price:
                 return {"success": False, "error": f"Cannot get price for {symbol}"}
 
             ask = price.get("ask")
             bid = price.get("bid")
-
-            # Get symbol specification for pip calculation
-            spec = await self.connection.get_symbol_specification(symbol)
             digits = spec.get("digits", 5)
-            pip_size = 0.01 if digits == 3 or digits == 2 else 0.0001
-            # Special handling for JPY pairs and gold
-            if "JPY" in symbol:
-                pip_size = 0.01
-            elif symbol in ("XAUUSD", "GOLD"):
-                pip_size = 0.1
-
-            sl_pips = sl_pips or Config.DEFAULT_SL_PIPS
-            tp_pips = tp_pips or Config.DEFAULT_TP_PIPS
-
-            trade_params = {
-                "symbol": symbol,
-                "volume": lot_size,
-            }
-
-            if action.lower() == "buy":
-                trade_params["actionType"] = "ORDER_TYPE_BUY"
-                if sl_pips:
-                    trade_params["stopLoss"] = round(bid - sl_pips * pip_size, digits)
-                if tp_pips:
-                    trade_params["takeProfit"] = round(
-                        ask + tp_pips * pip_size, digits
-                    )
-            elif action.lower() == "sell":
-                trade_params["actionType"] = "ORDER_TYPE_SELL"
-                if sl_pips:
-                    trade_params["stopLoss"] = round(ask + sl_pips * pip_size, digits)
-                if tp_pips:
-                    trade_params["takeProfit"] = round(
-                        bid - tp_pips * pip_size, digits
-                    )
+            pip_size = self._pip_size(symbol, digits)
+
+            sl, tp = _sl_tp(action, ask, bid, trade.sl_pips, trade.tp_pips, pip_size, digits)
+            place_order = getattr(self.connection, _ORDER_METHODS[action])
+            result = await place_order(symbol, lot_size, sl, tp)
+
+            self._account_info = None  # margin changed
+            position_id = result.get("positionId") if isinstance(result, dict) else None
+            if position_id is not None:
+                self._positions_by_id[str(position_id)] = {
+                    "id": position_id,
+                    "symbol": symbol,
+                }
             else:
-                return {"success": False, "error": f"Invalid action: {action}"}
-
-            result = await self.connection.create_market_buy_order(
-                symbol, lot_size, trade_params.get("stopLoss"),
-                trade_params.get("takeProfit")
-            ) if action.lower() == "buy" else await self.connection.create_market_sell_order(
-                symbol, lot_size, trade_params.get("stopLoss"),
-                trade_params.get("takeProfit")
-            )
+                self._positions_synced_at = 0.0  # unknown id, resync on next trade
 
             logger.info(
                 f"Trade opened: {action.upper()} {lot_size} {symbol} | "
-                f"SL: {trade_params.get('stopLoss')} | "
-                f"TP: {trade_params.get('takeProfit')}"
+                f"SL: {sl} | "
+                f"TP: {tp}"
             )
 
             return {
@@ -183,15 +487,41 @@ class MT5Trader:
                 "action": action.upper(),
                 "symbol": symbol,
                 "lot_size": lot_size,
-                "sl": trade_params.get("stopLoss"),
-                "tp": trade_params.get("takeProfit"),
-                "result": str(result),
+                "sl": sl,
+                "tp": tp,
+                "result": _trade_result(result),
             }
 
         except Exception as e:
             logger.error(f"Failed to open trade: {e}")
             return {"success": False, "error": str(e)}
 
+    async def _close_positions(self, positions):
+        """
+        Close positions concurrently over the shared RPC connection.
+
+        Returns:
+            (closed, failed) lists of per-position result dicts
+        """
+        results = await asyncio.gather(
+            *(self.connection.close_position(pos.get("id")) for pos in positions),
+            return_exceptions=True,
+        )
+        self._account_info = None  # balance/margin changed
+        closed = []
+        failed = []
+        for pos, result in zip(positions, results, strict=True):
+            pid = pos.get("id")
+            psym = pos.get("symbol")
+            if isinstance(result, Exception):
+                logger.error(f"Failed to close position {pid}: {result}")
+                failed.append({"id": pid, "symbol": psym, "error": str(result)})
+                continue
+            self._positions_by_id.pop(str(pid), None)
+            closed.append({"id": pid, "symbol": psym, "result": _trade_result(result)})
+            logger.info(f"Closed position: {pid} {psym}")
+        return closed, failed
+
     async def close_trade(self, symbol=None, position_id=None):
         """
         Close a trade by symbol or position ID.
@@ -203,38 +533,32 @@ class MT5Trader:
         Returns:
             Result dict
         """
-        if not self.connected:
-            await self.connect()
+        await self.ensure_connected()
 
         try:
-            positions = await self.get_open_positions()
-            closed = []
-
-            for pos in positions:
-                should_close = False
-                if position_id and str(pos.get("id")) == str(position_id):
-                    should_close = True
-                elif symbol and pos.get("symbol") == symbol:
-                    should_close = True
-
-                if should_close:
-                    result = await self.connection.close_position(pos.get("id"))
-                    closed.append(
-                        {
-                            "id": pos.get("id"),
-                            "symbol": pos.get("symbol"),
-                            "result": str(result),
-                        }
-                    )
-                    logger.info(f"Closed position: {pos.get('id')} {pos.get('symbol')}")
-
-            if not closed:
+            # Refresh the id index, then look the id up directly
+            await self.get_open_positions()
+            by_id = self._positions_by_id
+            to_close = {}
+            if position_id and str(position_id) in by_id:
+                to_close[str(position_id)] = by_id[str(position_id)]
+            if symbol:
+                for pid, pos in by_id.items():
+                    if pos.get("symbol") == symbol:
+                        to_close[pid] = pos
+            to_close = list(to_close.values())
+
+            if not to_close:
                 return {
                     "success": False,
                     "error": "No matching positions found to close",
                 }
 
-            return {"success": True, "closed_positions": closed}
+            closed, failed = await self._close_positions(to_close)
+            response = {"success": not failed, "closed_positions": closed}
+            if failed:
+                response["failed_positions"] = failed
+            return response
 
         except Exception as e:
             logger.error(f"Failed to close trade: {e}")
@@ -242,25 +566,16 @@ class MT5Trader:
 
     async def close_all(self):
         """Close all open positions."""
-        if not self.connected:
-            await self.connect()
+        await self.ensure_connected()
 
         try:
             positions = await self.get_open_positions()
-            closed = []
-
-            for pos in positions:
-                result = await self.connection.close_position(pos.get("id"))
-                closed.append(
-                    {
-                        "id": pos.get("id"),
-                        "symbol": pos.get("symbol"),
-                        "result": str(result),
-                    }
-                )
-                logger.info(f"Closed position: {pos.get('id')} {pos.get('symbol')}")
+            closed, failed = await self._close_positions(positions)
 
-            return {"success": True, "closed_count": len(closed), "closed": closed}
+            response = {"success": not failed, "closed_count": len(closed), "closed": closed}
+            if failed:
+                response["failed"] = failed
+            return response
 
         except Exception as e:
             logger.error(f"Failed to close all trades: {e}")
@@ -0,0 +1,93 @@
+"""Shared fixtures: an MT5Trader wired to an in-memory fake of the MetaApi RPC connection."""
+
+import asyncio
+import itertools
+
+import pytest
+
+from config import Config
+from mt5_trader import MT5Trader
+
+PRICES = {
+    "EURUSD": {"bid": 1.1000, "ask": 1.1002},
+    "USDJPY": {"bid": 150.00, "ask": 150.02},
+}
+DIGITS = {"EURUSD": 5, "USDJPY": 3}
+
+
+class FakeConnection:
+    """Records RPC calls and keeps a broker-side list of open positions."""
+
+    def __init__(self):
+        self.calls = []
+        self.positions = []
+        self.failing_symbols = set()  # get_symbol_price raises for these
+        self.failing_closes = set()  # close_position raises for these ids
+        self._ids = itertools.count(100)
+
+    async def get_positions(self):
+        self.calls.append(("get_positions",))
+        return [dict(pos) for pos in self.positions]
+
+    async def get_account_information(self):
+        self.calls.append(("get_account_information",))
+        return {"balance": 1000.0, "equity": 1000.0, "freeMargin": 900.0}
+
+    async def get_symbol_price(self, symbol):
+        self.calls.append(("get_symbol_price", symbol))
+        await asyncio.sleep(0)  # yield like a network round-trip would
+        if symbol in self.failing_symbols:
+            raise RuntimeError(f"no price for {symbol}")
+        return PRICES[symbol]
+
+    async def get_symbol_specification(self, symbol):
+        self.calls.append(("get_symbol_specification", symbol))
+        return {"symbol": symbol, "digits": DIGITS[symbol]}
+
+    async def _order(self, action, symbol, volume, sl, tp):
+        self.calls.append((action, symbol, volume, sl, tp))
+        await asyncio.sleep(0)
+        position_id = str(next(self._ids))
+        self.positions.append({"id": position_id, "symbol": symbol})
+        return {
+            "numericCode": 10009,
+            "stringCode": "TRADE_RETCODE_DONE",
+            "orderId": position_id,
+            "positionId": position_id,
+        }
+
+    async def create_market_buy_order(self, symbol, volume, sl=None, tp=None):
+        return await self._order("buy", symbol, volume, sl, tp)
+
+    async def create_market_sell_order(self, symbol, volume, sl=None, tp=None):
+        return await self._order("sell", symbol, volume, sl, tp)
+
+    async def close_position(self, position_id):
+        self.calls.append(("close_position", position_id))
+        if position_id in self.failing_closes:
+            raise RuntimeError(f"cannot close {position_id}")
+        self.positions = [pos for pos in self.positions if pos["id"] != position_id]
+        return {"stringCode": "TRADE_RETCODE_DONE", "positionId": position_id}
+
+    def count(self, name):
+        return sum(1 for call in self.calls if call[0] == name)
+
+
+@pytest.fixture
+def connection():
+    return FakeConnection()
+
+
+@pytest.fixture
+def trader(connection, monkeypatch):
+    """A connected trader; no spec cache file, no streaming, a 3-trade cap."""
+    monkeypatch.setattr(Config, "SPEC_CACHE_PATH", "")
+    monkeypatch.setattr(Config, "STREAM_PRICES", False)
+    monkeypatch.setattr(Config, "MAX_OPEN_TRADES", 3)
+    monkeypatch.setattr(Config, "MAX_LOT_SIZE", 1.0)
+    monkeypatch.setattr(Config, "DEFAULT_SL_PIPS", 50.0)
+    monkeypatch.setattr(Config, "DEFAULT_TP_PIPS", 100.0)
+    t = MT5Trader()
+    t.connection = connection
+    t.connected = True
+    return t
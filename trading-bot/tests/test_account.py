@@ -0,0 +1,15 @@
+"""Tests for the memoized account information."""
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_account_info_memoized_until_trade(trader, connection):
+    first = await trader.get_account_info()
+    await trader.get_account_info()
+    assert connection.count("get_account_information") == 1
+    assert first["free_margin"] == 900.0
+
+    await trader.open_trade("EURUSD", "buy", 0.1)
+    await trader.get_account_info()
+    assert connection.count("get_account_information") == 2
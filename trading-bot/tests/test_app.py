@@ -0,0 +1,191 @@
+"""Tests for the Flask app."""
+
+import threading
+import time
+from collections import deque
+
+import pytest
+
+import app
+
+
+class StubTrader:
+    """Stands in for MT5Trader behind the webhook; records calls, always succeeds."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def open_trade(self, symbol, action, lot_size, sl_pips=None, tp_pips=None):
+        self.calls.append(("open_trade", symbol, action, lot_size, sl_pips, tp_pips))
+        return {"success": True, "action": action.upper(), "symbol": symbol}
+
+    async def close_trade(self, symbol=None, position_id=None):
+        self.calls.append(("close_trade", symbol, position_id))
+        return {"success": True, "closed_positions": []}
+
+    async def close_all(self):
+        self.calls.append(("close_all",))
+        return {"success": True, "closed_count": 0, "closed": []}
+
+
+@pytest.fixture
+def trader(monkeypatch):
+    stub = StubTrader()
+    monkeypatch.setattr(app, "_trader", stub)
+    monkeypatch.setattr(app, "trade_log", deque(maxlen=app.MAX_LOG_SIZE))
+    monkeypatch.setattr(app, "_SECRET_BYTES", b"")
+    monkeypatch.setattr(app, "_REQUIRE_AUTH", False)
+    return stub
+
+
+@pytest.fixture
+def client(trader):
+    return app.app.test_client()
+
+
+def test_get_trader_builds_one_trader_across_threads(monkeypatch):
+    built = []
+
+    class SlowTrader:
+        def __init__(self):
+            time.sleep(0.01)  # widen the race window
+            built.append(self)
+
+    monkeypatch.setattr(app, "MT5Trader", SlowTrader)
+    monkeypatch.setattr(app, "_trader", None)
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def worker():
+        barrier.wait()
+        seen.append(app.get_trader())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(built) == 1
+    assert all(trader is built[0] for trader in seen)
+
+
+def test_webhook_normalizes_action_and_symbol(client, trader):
+    resp = client.post("/webhook", json={"action": "BUY", "symbol": "eurusd", "lot_size": "0.2"})
+
+    assert resp.status_code == 200
+    assert trader.calls == [("open_trade", "EURUSD", "buy", 0.2, None, None)]
+
+
+def test_webhook_accepts_text_plain_json(client, trader):
+    resp = client.post(
+        "/webhook", data='{"action": "sell", "symbol": "XAUUSD"}', content_type="text/plain"
+    )
+
+    assert resp.status_code == 200
+    assert trader.calls[0][1:3] == ("XAUUSD", "sell")
+
+
+@pytest.mark.parametrize(
+    "body, error",
+    [
+        ("not json", "Invalid JSON"),
+        ("", "No data received"),
+        ("[1, 2]", "Invalid payload"),
+        ('{"action": "buy", "symbol": "EURUSD", "lot_size": "lots"}', "Invalid payload"),
+        ('{"action": "hold", "symbol": "EURUSD"}', "Unknown action: hold"),
+        ('{"action": "buy"}', "Symbol is required for buy/sell"),
+    ],
+)
+def test_webhook_rejects_bad_payload(client, trader, body, error):
+    resp = client.post("/webhook", data=body, content_type="application/json")
+
+    assert resp.status_code == 400
+    assert resp.get_json()["error"] == error
+    assert trader.calls == []
+
+
+def test_webhook_reports_validation_details(client):
+    resp = client.post("/webhook", json={"action": "buy", "symbol": "EURUSD", "sl_pips": "far"})
+
+    details = resp.get_json()["details"]
+    assert [d["loc"] for d in details] == [["sl_pips"]]
+
+
+@pytest.mark.parametrize(
+    "body, call",
+    [
+        ({"action": "Close", "symbol": "eurusd"}, ("close_trade", "EURUSD", None)),
+        ({"action": "close", "symbol": "EURUSD", "position_id": 7}, ("close_trade", "EURUSD", 7)),
+        ({"action": "CLOSE_ALL"}, ("close_all",)),
+    ],
+)
+def test_webhook_dispatches_close_actions(client, trader, body, call):
+    resp = client.post("/webhook", json=body)
+
+    assert resp.status_code == 200
+    assert trader.calls == [call]
+
+
+@pytest.fixture
+def secret(monkeypatch):
+    monkeypatch.setattr(app, "_SECRET_BYTES", b"s3cret")
+    monkeypatch.setattr(app, "_REQUIRE_AUTH", True)
+    return "s3cret"
+
+
+@pytest.mark.parametrize("extra", [{}, {"secret": "wrong"}, {"secret": ""}, {"secret": None}])
+def test_webhook_rejects_missing_or_wrong_secret(client, trader, secret, extra):
+    resp = client.post("/webhook", json={"action": "buy", "symbol": "EURUSD", **extra})
+
+    assert resp.status_code == 401
+    assert resp.get_json() == {"error": "Unauthorized"}
+    assert trader.calls == []
+
+
+def test_webhook_accepts_matching_secret(client, trader, secret):
+    resp = client.post("/webhook", json={"action": "buy", "symbol": "EURUSD", "secret": secret})
+
+    assert resp.status_code == 200
+    assert len(trader.calls) == 1
+
+
+def test_webhook_open_when_no_secret_configured(client, trader):
+    resp = client.post("/webhook", json={"action": "buy", "symbol": "EURUSD", "secret": "any"})
+
+    assert resp.status_code == 200
+
+
+def test_trades_empty(client):
+    resp = client.get("/trades")
+
+    assert resp.mimetype == "application/json"
+    assert resp.get_json() == {"trades": [], "total": 0}
+
+
+def test_trades_lists_logged_trades_with_iso_timestamps(client, monkeypatch):
+    monkeypatch.setattr(app.time, "time", lambda: 1700000000.5)
+    client.post("/webhook", json={"action": "buy", "symbol": "EURUSD"})
+    client.post("/webhook", json={"action": "close_all"})
+
+    body = client.get("/trades").get_json()
+
+    assert body["total"] == 2
+    assert [t["action"] for t in body["trades"]] == ["buy", "close_all"]
+    assert body["trades"][0] == {
+        "timestamp": "2023-11-14T22:13:20.500000+00:00",
+        "action": "buy",
+        "data": {"action": "buy", "symbol": "EURUSD"},
+        "result": {"success": True, "action": "BUY", "symbol": "EURUSD"},
+    }
+
+
+def test_trades_keeps_only_the_latest_entries(client, monkeypatch):
+    monkeypatch.setattr(app, "trade_log", deque(maxlen=2))
+    for action in ("buy", "sell", "close_all"):
+        client.post("/webhook", json={"action": action, "symbol": "EURUSD"})
+
+    body = client.get("/trades").get_json()
+
+    assert body["total"] == 2
+    assert [t["action"] for t in body["trades"]] == ["sell", "close_all"]
@@ -0,0 +1,29 @@
+"""Tests for closing positions."""
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_close_all_reports_partial_failures(trader, connection):
+    connection.positions = [{"id": str(i), "symbol": "EURUSD"} for i in range(3)]
+    connection.failing_closes = {"1"}
+
+    result = await trader.close_all()
+
+    assert result["success"] is False
+    assert result["closed_count"] == 2
+    assert [p["id"] for p in result["closed"]] == ["0", "2"]
+    assert result["failed"] == [{"id": "1", "symbol": "EURUSD", "error": "cannot close 1"}]
+    assert connection.count("close_position") == 3
+
+
+@pytest.mark.asyncio
+async def test_close_trade_by_id_and_no_match(trader, connection):
+    connection.positions = [{"id": "1", "symbol": "EURUSD"}, {"id": "2", "symbol": "USDJPY"}]
+
+    result = await trader.close_trade(position_id=2)
+    assert result["success"] is True
+    assert [p["id"] for p in result["closed_positions"]] == ["2"]
+
+    missing = await trader.close_trade(symbol="GBPUSD")
+    assert missing == {"success": False, "error": "No matching positions found to close"}
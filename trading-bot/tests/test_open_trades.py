@@ -0,0 +1,40 @@
+"""Tests for the batched open_trades entry point."""
+
+import pytest
+
+
+def _signal(symbol, action, lot_size=0.1, **kwargs):
+    return {"symbol": symbol, "action": action, "lot_size": lot_size, **kwargs}
+
+
+@pytest.mark.asyncio
+async def test_open_trades_allocates_slots_in_signal_order(trader, connection):
+    connection.positions = [{"id": "1", "symbol": "EURUSD"}]  # 2 of 3 slots free
+
+    results = await trader.open_trades(
+        [
+            _signal("EURUSD", "buy"),
+            _signal("USDJPY", "hold"),
+            _signal("USDJPY", "sell"),
+            _signal("EURUSD", "buy"),
+        ]
+    )
+
+    assert [r["success"] for r in results] == [True, False, True, False]
+    assert results[0]["symbol"] == "EURUSD"
+    assert results[1]["error"] == "Invalid action: hold"
+    assert results[2]["symbol"] == "USDJPY" and results[2]["action"] == "SELL"
+    assert results[3]["error"] == "Max open trades limit (3) reached"
+    # One quote per distinct accepted symbol
+    assert connection.count("get_symbol_price") == 2
+
+
+@pytest.mark.asyncio
+async def test_open_trades_maps_quote_failure_to_its_trades(trader, connection):
+    connection.failing_symbols = {"USDJPY"}
+
+    results = await trader.open_trades([_signal("USDJPY", "buy"), _signal("EURUSD", "buy")])
+
+    assert results[0] == {"success": False, "error": "no price for USDJPY"}
+    assert results[1]["success"] is True
+    assert connection.count("buy") == 1
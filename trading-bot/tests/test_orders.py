@@ -0,0 +1,50 @@
+"""Tests for order pricing and placement."""
+
+import pytest
+
+from mt5_trader import pip_size_for
+
+
+@pytest.mark.parametrize(
+    "symbol, digits, expected",
+    [("EURUSD", 5, 0.0001), ("USDJPY", 3, 0.01), ("XAUUSD", 2, 0.1), ("US30", 2, 0.01)],
+)
+def test_pip_size_for(symbol, digits, expected):
+    assert pip_size_for(symbol, digits) == expected
+
+
+@pytest.mark.asyncio
+async def test_open_trade_measures_sl_tp_from_entry_price(trader, connection):
+    buy = await trader.open_trade("EURUSD", "BUY", 0.1, sl_pips=50, tp_pips=100)
+    sell = await trader.open_trade("EURUSD", "sell", 0.1, sl_pips=50, tp_pips=100)
+
+    assert buy["success"] and buy["action"] == "BUY"
+    assert (buy["sl"], buy["tp"]) == (1.0952, 1.1102)  # from ask 1.1002
+    assert (sell["sl"], sell["tp"]) == (1.105, 1.09)  # from bid 1.1000
+    orders = [call for call in connection.calls if call[0] in ("buy", "sell")]
+    assert orders == [
+        ("buy", "EURUSD", 0.1, 1.0952, 1.1102),
+        ("sell", "EURUSD", 0.1, 1.105, 1.09),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_open_trade_caps_lot_size_and_rejects_bad_action(trader, connection):
+    result = await trader.open_trade("EURUSD", "buy", 5.0)
+    assert result["lot_size"] == 1.0
+
+    bad = await trader.open_trade("EURUSD", "hold", 0.1)
+    assert bad == {"success": False, "error": "Invalid action: hold"}
+    assert connection.count("buy") == 1
+
+
+@pytest.mark.asyncio
+async def test_open_trade_returns_trimmed_order_result(trader):
+    result = await trader.open_trade("EURUSD", "buy", 0.1)
+
+    # numericCode and anything else in the SDK response are dropped
+    assert result["result"] == {
+        "stringCode": "TRADE_RETCODE_DONE",
+        "orderId": "100",
+        "positionId": "100",
+    }
@@ -0,0 +1,51 @@
+"""Tests for the locally tracked open positions and the max open trades cap."""
+
+import asyncio
+
+import pytest
+
+from config import Config
+
+
+@pytest.mark.asyncio
+async def test_position_closed_at_broker_frees_its_slot(trader, connection):
+    for _ in range(3):
+        assert (await trader.open_trade("EURUSD", "buy", 0.1))["success"]
+
+    connection.positions.pop()  # SL hit at the broker, within the resync window
+    result = await trader.open_trade("EURUSD", "buy", 0.1)
+
+    assert result["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_cap_enforced_after_resync(trader, connection):
+    connection.positions = [{"id": str(i), "symbol": "EURUSD"} for i in range(3)]
+
+    result = await trader.open_trade("EURUSD", "buy", 0.1)
+
+    assert result["success"] is False
+    assert connection.count("buy") == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_opens_respect_cap(trader, connection, monkeypatch):
+    monkeypatch.setattr(Config, "MAX_OPEN_TRADES", 1)
+
+    results = await asyncio.gather(*(trader.open_trade("EURUSD", "buy", 0.1) for _ in range(3)))
+
+    assert sum(r["success"] for r in results) == 1
+    assert len(connection.positions) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_open_releases_its_slot(trader, connection, monkeypatch):
+    monkeypatch.setattr(Config, "MAX_OPEN_TRADES", 1)
+    connection.failing_symbols = {"USDJPY"}
+
+    failed = await trader.open_trade("USDJPY", "buy", 0.1)
+    opened = await trader.open_trade("EURUSD", "buy", 0.1)
+
+    assert failed["success"] is False
+    assert opened["success"] is True
+    assert trader._pending_opens == 0
@@ -0,0 +1,65 @@
+"""Tests for the symbol specification cache."""
+
+import json
+import time
+
+import pytest
+
+import mt5_trader
+from mt5_trader import SPEC_CACHE_TTL, _load_spec_cache, _save_spec_cache
+
+
+@pytest.mark.asyncio
+async def test_spec_fetched_once_per_symbol(trader, connection):
+    await trader.open_trade("EURUSD", "buy", 0.1)
+    await trader.open_trade("EURUSD", "sell", 0.1)
+    assert connection.count("get_symbol_specification") == 1
+    assert connection.count("get_symbol_price") == 2
+
+
+def test_spec_cache_round_trip(tmp_path):
+    path = str(tmp_path / "specs.json")
+    now = time.time()
+    cache = {
+        "EURUSD": ({"digits": 5}, now),
+        "USDJPY": ({"digits": 3}, now - SPEC_CACHE_TTL - 1),
+    }
+
+    _save_spec_cache(path, cache)
+
+    assert json.loads((tmp_path / "specs.json").read_text())["EURUSD"]["spec"] == {"digits": 5}
+    assert _load_spec_cache(path) == {"EURUSD": ({"digits": 5}, now)}  # expired entry dropped
+    assert [f.name for f in tmp_path.iterdir()] == ["specs.json"]  # no temp files left
+
+
+def test_spec_cache_skips_unserializable_spec(tmp_path):
+    path = tmp_path / "specs.json"
+    _save_spec_cache(str(path), {"EURUSD": ({"digits": 5}, time.time())})
+    before = path.read_text()
+
+    _save_spec_cache(str(path), {"EURUSD": ({"digits": 5, "expires": object()}, time.time())})
+
+    assert path.read_text() == before
+    assert [f.name for f in tmp_path.iterdir()] == ["specs.json"]
+
+
+def test_spec_cache_ignores_unreadable_file(tmp_path):
+    path = tmp_path / "specs.json"
+    path.write_text("{not json")
+    assert _load_spec_cache(str(path)) == {}
+    assert _load_spec_cache(str(tmp_path / "missing.json")) == {}
+
+
+@pytest.mark.asyncio
+async def test_trader_uses_persisted_specs(trader, connection, tmp_path, monkeypatch):
+    path = str(tmp_path / "specs.json")
+    monkeypatch.setattr(mt5_trader.Config, "SPEC_CACHE_PATH", path)
+    await trader.open_trade("EURUSD", "buy", 0.1)
+
+    fresh = mt5_trader.MT5Trader()
+    fresh.connection = connection
+    fresh.connected = True
+    fresh._spec_cache = _load_spec_cache(path)
+    await fresh.open_trade("EURUSD", "buy", 0.1)
+
+    assert connection.count("get_symbol_specification") == 1